@@ -23,13 +23,16 @@ class _Audit(_plugins.Action):
         _colors.cyan.bold.print(f"\n{_NAME} {self.name}")
         _colors.green.underline.print(_messages.AUDIT_RUNNING)
         results = []
+        registered = _plugins.registered()
+        passed = _colors.green.get("\u2713")
+        failed = _colors.red.get("\u2716")
         print(f"{bullet} " + f"\n{bullet} ".join(audit))
         for func in audit:
-            symbol = _colors.green.get("\u2713")
-            if func in _plugins.registered():
+            symbol = passed
+            if func in registered:
                 _colors.cyan.bold.print(f"\n{_NAME} {func}")
                 if _plugins.get(func)(**kwargs):
-                    symbol = _colors.red.get("\u2716")
+                    symbol = failed
                     returncode = 1
                     message = _colors.red.bold.get(_messages.AUDIT_FAILED)
 
@@ -46,12 +49,13 @@ class _Modules(_plugins.Action):
     def action(self, *args: str, **kwargs: _t.Any) -> int:
         print()
         mapping = _plugins.mapping()
+        width = max(map(len, mapping), default=0) + 1
         for key in sorted(mapping):
             doc = _inspect.getdoc(mapping[key])
             if doc is not None:
                 print(
                     "{}-- {}".format(
-                        key.ljust(len(max(mapping, key=len)) + 1),
+                        key.ljust(width),
                         doc.splitlines()[0][:-1].replace("``", "`"),
                     )
                 )
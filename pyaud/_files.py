@@ -9,6 +9,8 @@ import contextlib as _contextlib
 import copy
 import sys as _sys
 import typing as _t
+from collections import Counter as _Counter
+from pathlib import Path as _Path
 
 from lsfiles import LSFiles as _LSFiles
 
@@ -21,6 +23,54 @@ class _Files(_LSFiles):
         super().__init__()
         self._state = self
 
+        # mirror of the index so duplicate checks are not a list scan,
+        # counted as assigning by index can briefly hold a path twice
+        self._paths: _t.Counter[_Path] = _Counter()
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            return value in self._paths
+        except TypeError:
+            return False
+
+    def __delitem__(self, i: int | slice) -> None:  # type: ignore
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._paths = _Counter(self._list)
+        else:
+            self._uncount(self._list[i])
+            super().__delitem__(i)
+
+    def __setitem__(self, i: int | slice, o: _t.Any) -> None:  # type: ignore
+        if isinstance(i, slice):
+            super().__setitem__(i, o)
+            self._paths = _Counter(self._list)
+        else:
+            old = self._list[i]
+            super().__setitem__(i, o)
+            self._uncount(old)
+            self._paths[o] += 1
+
+    def _uncount(self, value: _Path) -> None:
+        self._paths[value] -= 1
+        if not self._paths[value]:
+            del self._paths[value]
+
+    def clear(self) -> None:
+        """Remove all paths from index."""
+        self._list.clear()
+        self._paths.clear()
+
+    def insert(self, index: int, value: _Path) -> None:
+        """Insert values into index if not already indexed.
+
+        :param index: Position to insert ``value``.
+        :param value: Path to insert into index.
+        """
+        if value not in self._paths:
+            self._list.insert(index, value)
+            self._paths[value] += 1
+
     def populate(self, exclude: str | None = None) -> None:
         super().populate(exclude)
         if not all(i.is_file() for i in self):
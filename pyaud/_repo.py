@@ -0,0 +1,72 @@
+"""
+pyaud._repo
+===========
+
+Read-only queries of the repository, made once per session.
+"""
+
+from __future__ import annotations as _annotations
+
+import contextlib as _contextlib
+import functools as _functools
+import typing as _t
+from pathlib import Path as _Path
+
+import git as _git
+
+# sessions in progress, results are kept until the outermost one exits
+_sessions: list[None] = []
+
+
+@_functools.lru_cache(maxsize=None)
+def get(path: _Path) -> _git.Repo:
+    """Get the repository at path.
+
+    :param path: Path to repository.
+    :return: Repository object.
+    """
+    return _git.Repo(path)
+
+
+@_functools.lru_cache(maxsize=None)
+def commits(path: _Path) -> frozenset[str]:
+    """Get all commits in the repository at path.
+
+    :param path: Path to repository.
+    :return: Set of commit hashes.
+    """
+    return frozenset(get(path).git.rev_list(all=True).splitlines())
+
+
+@_functools.lru_cache(maxsize=None)
+def head(path: _Path) -> str:
+    """Get the commit checked out in the repository at path.
+
+    :param path: Path to repository.
+    :return: Commit hash.
+    """
+    return get(path).git.rev_parse("HEAD")
+
+
+def clear() -> None:
+    """Clear results so the repository is queried again."""
+    get.cache_clear()
+    commits.cache_clear()
+    head.cache_clear()
+
+
+@_contextlib.contextmanager
+def session() -> _t.Generator[None, None, None]:
+    """Keep results until the outermost session exits.
+
+    Sessions entered while another is in progress share its results.
+
+    :return: Generator for the duration of the session.
+    """
+    _sessions.append(None)
+    try:
+        yield
+    finally:
+        _sessions.pop()
+        if not _sessions:
+            clear()
@@ -7,13 +7,15 @@ Main module used for public API.
 
 from __future__ import annotations as _annotations
 
+import functools as _functools
 import hashlib as _hashlib
 import importlib as _importlib
-import inspect as _inspect
 import json as _json
 import pkgutil as _pkgutil
 import re as _re
+import stat as _stat
 import sys as _sys
+import time as _time
 import typing as _t
 from abc import ABC as _ABC
 from abc import abstractmethod as _abstractmethod
@@ -22,7 +24,7 @@ from subprocess import CalledProcessError as _CalledProcessError
 
 import git as _git
 
-from . import _cachedir
+from . import _cachedir, _repo
 from . import messages as _messages
 from ._files import files as _files
 from ._objects import NAME as _NAME
@@ -30,6 +32,27 @@ from ._objects import colors as _colors
 from .exceptions import NameConflictError as _NameConflictError
 
 IMPORT_RE = _re.compile("^pyaud[-_].*$")
+_CHUNK_SIZE = 1 << 16
+
+# block every file is read into, allocated once rather than per file
+_BLOCK = bytearray(_CHUNK_SIZE)
+_BLOCK_VIEW = memoryview(_BLOCK)
+
+# files modified more recently than this may change without their mtime
+# changing, depending on the resolution of the filesystem's timestamps
+_RACY_NS = 2_000_000_000
+
+# raised on reading a path that is no longer a regular file
+_NOT_A_FILE = (FileNotFoundError, IsADirectoryError, NotADirectoryError)
+
+# digests of files, and the stat they were taken at, so files checked by
+# more than one plugin in a session are only read once
+_digests: dict[_Path, tuple[tuple[int, int, int, int], str]] = {}
+
+# resolve styles used by every wrapped call once, as attribute lookups
+# on ``Color`` objects fall back through a caught ``AttributeError``
+_success = _colors.green.bold
+_failure = _colors.red.bold
 
 
 # persistent data object
@@ -42,22 +65,21 @@ class _HashMapping:
         self._path = _cachedir.PATH / "files.json"
         self._dict: dict[str, _t.Any] = {}
         self._cwd = _Path.cwd()
-        repo = _git.Repo(self._cwd)
-        if self._path.is_file():
-            try:
-                self._dict.update(_json.loads(self._path.read_text()))
+        repo = _repo.get(self._cwd)
+        try:
+            self._dict.update(_json.loads(self._path.read_text()))
 
-                # remove cache of commits with no revision
-                commits = repo.git.rev_list(all=True).splitlines()
-                for commit in dict(self._dict):
-                    if commit not in commits and commit != self.FALLBACK:
-                        del self._dict[commit]
-            except _json.decoder.JSONDecodeError:
-                pass
+            # remove cache of commits with no revision
+            commits = _repo.commits(self._cwd)
+            for commit in dict(self._dict):
+                if commit not in commits and commit != self.FALLBACK:
+                    del self._dict[commit]
+        except (*_NOT_A_FILE, _json.decoder.JSONDecodeError):
+            pass
 
         if not repo.git.status(short=True):
             try:
-                self._head = repo.git.rev_parse("HEAD")
+                self._head = _repo.head(self._cwd)
             except _git.GitCommandError:
                 self._head = self.FALLBACK
 
@@ -72,29 +94,67 @@ class _HashMapping:
         :return: Is the file a match (not changed)? True or False.
         """
         relpath = str(path.relative_to(self._cwd))
-        newhash = _hashlib.new(  # type: ignore
-            "md5", path.read_bytes(), usedforsecurity=False
-        ).hexdigest()
-        return newhash == self._session.get(relpath)
+        digest = self._hash_file(path)
+        return digest is not None and digest == self._session.get(relpath)
 
-    def save_hash(self, path: _Path) -> None:
-        """Populate file hash.
+    def save_hash(self, *paths: _Path) -> None:
+        """Populate file hashes.
 
-        :param path: Path to hash.
+        The cache is written once all paths have been hashed.
+
+        :param paths: Paths to hash.
         """
-        relpath = str(path.relative_to(self._cwd))
-        if path.is_file():
-            newhash = _hashlib.new(  # type: ignore
-                "md5", path.read_bytes(), usedforsecurity=False
-            ).hexdigest()
-            self._session[relpath] = newhash
-        else:
-            if relpath in self._session:
-                del self._session[relpath]
+        for path in paths:
+            relpath = str(path.relative_to(self._cwd))
+            digest = self._hash_file(path)
+            if digest is None:
+                self._session.pop(relpath, None)
+            else:
+                self._session[relpath] = digest
 
         cls = {self._cls: self._session}
         self._nested_update(self._dict, {self.FALLBACK: cls, self._head: cls})
-        self._path.write_text(_json.dumps(self._dict, separators=(",", ":")))
+
+        # nothing is persisted if the cache path is not writable as a
+        # file, in the same way that it is not read
+        try:
+            self._path.write_text(
+                _json.dumps(self._dict, separators=(",", ":"))
+            )
+        except IsADirectoryError:
+            pass
+
+    @staticmethod
+    def _hash_file(path: _Path) -> str | None:
+        # paths that are not regular files have no hash, opening a fifo
+        # would block and opening a socket would fail
+        try:
+            stat = path.stat()
+        except _NOT_A_FILE:
+            return None
+
+        if not _stat.S_ISREG(stat.st_mode):
+            return None
+
+        # skip reading the file if its stat is unchanged, the inode and
+        # ctime catch files replaced with the same mtime and size
+        key = stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_ctime_ns
+        cached = _digests.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # read unbuffered into the shared block so memory does not grow
+        # with the size of the file being hashed
+        obj = _hashlib.new("md5", usedforsecurity=False)  # type: ignore
+        with path.open("rb", buffering=0) as fin:
+            while size := fin.readinto(_BLOCK):
+                obj.update(_BLOCK_VIEW[:size])
+
+        digest = obj.hexdigest()
+        if _time.time_ns() - stat.st_mtime_ns > _RACY_NS:
+            _digests[path] = key, digest
+
+        return digest
 
     def _nested_update(
         self, obj: dict[str, _t.Any], update: dict[str, _t.Any]
@@ -124,23 +184,29 @@ def _cache_files_wrapper(
 ) -> int:
     returncode = 0
     hashed = _HashMapping(self.__class__)
+    # bind before looping over what may be every file in the project
+    match_file = hashed.match_file
+    cache_all = self.cache_all
     with _files.state() as state:
+        # update the index once, rather than removing unchanged files
+        # from it one at a time
+        changed: list[_Path] = []
         for file in state:
-            if hashed.match_file(file):
-                _files.remove(file)
-            else:
-                if self.cache_all:
-                    _files.restore()
+            if not match_file(file):
+                changed.append(file)
+                if cache_all:
                     break
 
+        if not cache_all or not changed:
+            _files[:] = changed
+
         if not _files and len(state):
-            _colors.green.bold.print(_messages.NO_FILES_CHANGED)
+            _success.print(_messages.NO_FILES_CHANGED)
         else:
             returncode = cls_call(self, *args, **kwargs)
 
-        if not returncode:
-            for path in _files:
-                hashed.save_hash(path)
+        if not returncode and _files:
+            hashed.save_hash(*_files)
 
     return returncode
 
@@ -173,14 +239,19 @@ def _cache_wrapper(cls: type[Plugin]) -> type[Plugin]:
     cls_call = cls.__call__
 
     def __call__(self: Plugin, *args: str, **kwargs: _t.Any) -> int:
-        if not kwargs.get("no_cache", False):
-            if cls.cache_file is not None:
-                return _cache_file_wrapper(self, cls_call, *args, **kwargs)
+        # plugins called by this one reuse its repository queries, which
+        # are discarded once it returns so later calls see new commits
+        with _repo.session():
+            if not kwargs.get("no_cache", False):
+                if cls.cache_file is not None:
+                    return _cache_file_wrapper(self, cls_call, *args, **kwargs)
+
+                if cls.cache and _files:
+                    return _cache_files_wrapper(
+                        self, cls_call, *args, **kwargs
+                    )
 
-            if cls.cache and _files:
-                return _cache_files_wrapper(self, cls_call, *args, **kwargs)
-
-        return cls_call(self, *args, **kwargs)
+            return cls_call(self, *args, **kwargs)
 
     setattr(cls, cls.__call__.__name__, __call__)
     return cls
@@ -193,12 +264,12 @@ def _file_wrapper(cls: PluginType) -> PluginType:
     def __call__(self, *args: str, **kwargs: _t.Any) -> int:
         returncode = cls_call(self, *args, **kwargs)
         if returncode:
-            _colors.red.bold.print(
+            _failure.print(
                 _messages.FAILED.format(returncode=returncode),
                 file=_sys.stderr,
             )
         else:
-            _colors.green.bold.print(_messages.SUCCESS_FILE)
+            _success.print(_messages.SUCCESS_FILE)
 
         return returncode
 
@@ -212,17 +283,15 @@ def _files_wrapper(cls: PluginType) -> PluginType:
 
     def __call__(self, *args: str, **kwargs: _t.Any) -> int:
         returncode = 0
-        if _files.reduce():
+        if _files:
             returncode = cls_call(self, *args, **kwargs)
             if returncode:
-                _colors.red.bold.print(
+                _failure.print(
                     _messages.FAILED.format(returncode=returncode),
                     file=_sys.stderr,
                 )
             else:
-                _colors.green.bold.print(
-                    _messages.SUCCESS_FILES.format(len=len(_files))
-                )
+                _success.print(_messages.SUCCESS_FILES.format(len=len(_files)))
 
         return returncode
 
@@ -596,17 +665,18 @@ def register(name: str | None = None) -> _t.Callable[[PluginType], PluginType]:
     """
 
     def _register(plugin: PluginType) -> PluginType:
-        plugin_name = name or _name_plugin(plugin)
+        plugin_name = _sys.intern(name or _name_plugin(plugin))
         if plugin_name in _plugins:
             raise _NameConflictError(plugin.__name__, plugin_name)
 
-        mro = tuple(p.__name__ for p in _inspect.getmro(plugin))
-        if not hasattr(plugin, "__bases__") or not any(
-            i in PLUGIN_NAMES for i in mro
-        ):
+        if not isinstance(plugin, type) or not issubclass(plugin, PLUGINS):
             raise TypeError(
                 _messages.TYPE_ERROR.format(
-                    valid=", ".join(PLUGIN_NAMES), invalid=mro
+                    valid=", ".join(PLUGIN_NAMES),
+                    invalid=tuple(
+                        p.__name__
+                        for p in getattr(plugin, "__mro__", (type(plugin),))
+                    ),
                 )
             )
         _plugins[plugin_name] = plugin(plugin_name)
@@ -628,7 +698,7 @@ def registered() -> list[str]:
 
     :return: List of registered plugins.
     """
-    return sorted(list(_plugins))
+    return sorted(_plugins)
 
 
 def get(name: str) -> Plugin:
@@ -646,8 +716,10 @@ def get(name: str) -> Plugin:
         return _plugins["modules"]
 
 
+# only walk ``sys.path`` for plugin packages once per session
+@_functools.lru_cache(maxsize=None)
 def load() -> None:
     """Import all package prefixed with ``pyaud[-_]``."""
     for _, name, _ in _pkgutil.iter_modules():
-        if IMPORT_RE.match(name):
+        if IMPORT_RE.match(name) and name not in _sys.modules:
             _importlib.import_module(name)
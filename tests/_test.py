@@ -9,9 +9,12 @@ from __future__ import annotations
 
 import datetime
 import subprocess
+import sys
 import typing as t
+from collections import Counter
 from pathlib import Path
 from subprocess import CalledProcessError
+from types import ModuleType
 
 import git
 import pytest
@@ -29,6 +32,7 @@ from . import (
     FixtureMain,
     FixtureMakeTree,
     FixtureMockActionPluginFactory,
+    FixtureMockRepo,
     PluginTuple,
     Tracker,
     plugin_class,
@@ -65,13 +69,15 @@ def test_register_plugin_name_conflict_error(
     [
         type("NotSubclassed", (), {}),
         type("Subclassed", (type("NotSubclassed", (), {}),), {}),
+        type("Named", (type("Action", (), {}),), {}),
+        type("Instance", (), {})(),
     ],
-    ids=["base", "child"],
+    ids=["base", "child", "named", "instance"],
 )
-def test_register_invalid_type(klass: type) -> None:
+def test_register_invalid_type(klass: object) -> None:
     """Test correct error is displayed when registering unknown type.
 
-    :param klass: Invalid type.
+    :param klass: Invalid type, or an instance of one.
     """
     with pytest.raises(TypeError) as err:
         pyaud.plugins.register(
@@ -103,6 +109,23 @@ def test_plugin_mro(
     assert "plugin-2" in pyaud.plugins.mapping()
 
 
+def test_registered(
+    mock_action_plugin_factory: FixtureMockActionPluginFactory,
+) -> None:
+    """Test registered plugins are listed after each registration.
+
+    :param mock_action_plugin_factory: Factory for creating mock action
+        plugin objects.
+    """
+    plugin_one, plugin_two = mock_action_plugin_factory(
+        PluginTuple(plugin_name[1]), PluginTuple(plugin_name[2])
+    )
+    pyaud.plugins.register(name=plugin_name[2])(plugin_two)
+    assert pyaud.plugins.registered() == [plugin_name[2]]
+    pyaud.plugins.register(name=plugin_name[1])(plugin_one)
+    assert pyaud.plugins.registered() == [plugin_name[1], plugin_name[2]]
+
+
 def test_audit_error_did_no_pass_all_checks(
     main: FixtureMain,
     mock_action_plugin_factory: FixtureMockActionPluginFactory,
@@ -246,10 +269,10 @@ def test_imports(
         (None, "pyaud_underscore", None),
         (None, "pyaud-dash", None),
     ]
-    monkeypatch.setattr("pyaud.plugins._importlib.import_module", tracker)
     monkeypatch.setattr(
         "pyaud.plugins._pkgutil.iter_modules", lambda: iter_modules
     )
+    monkeypatch.setattr("pyaud.plugins._importlib.import_module", tracker)
     make_tree(Path.cwd(), {"plugins": {INIT: None, python_file[1]: None}})
     pyaud.plugins.load()
     assert tracker.was_called()
@@ -257,6 +280,42 @@ def test_imports(
     assert tracker.kwargs == [{}, {}]
 
 
+@pytest.mark.usefixtures("unpatch_plugins_load")
+def test_imports_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test plugin packages are only searched for once per session.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    """
+    tracker = Tracker()
+    monkeypatch.setattr(
+        "pyaud.plugins._pkgutil.iter_modules",
+        lambda: [(None, "pyaud_underscore", None)],
+    )
+    monkeypatch.setattr("pyaud.plugins._importlib.import_module", tracker)
+    pyaud.plugins.load()
+    pyaud.plugins.load()
+    assert tracker.args == [("pyaud_underscore",)]
+
+
+@pytest.mark.usefixtures("unpatch_plugins_load")
+def test_imports_skip_imported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test plugin packages which are already imported are skipped.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    """
+    tracker = Tracker()
+    monkeypatch.setattr(
+        "pyaud.plugins._pkgutil.iter_modules",
+        lambda: [(None, "pyaud_underscore", None), (None, "pyaud-dash", None)],
+    )
+    monkeypatch.setitem(
+        sys.modules, "pyaud_underscore", ModuleType("pyaud_underscore")
+    )
+    monkeypatch.setattr("pyaud.plugins._importlib.import_module", tracker)
+    pyaud.plugins.load()
+    assert tracker.args == [("pyaud-dash",)]
+
+
 @pytest.mark.parametrize(
     "classname,expected",
     [
@@ -400,3 +459,83 @@ def test_keyboard_interrupt(
         main(plugin_name[1])
 
     assert "KeyboardInterrupt" in str(err)
+
+
+def test_files_index() -> None:
+    """Test file index holds no duplicates and tracks removals."""
+    paths = [Path.cwd() / python_file[i] for i in range(3)]
+    pyaud.files.extend([paths[0], paths[1], paths[0], paths[2]])
+    assert list(pyaud.files) == paths
+    pyaud.files.remove(paths[1])
+    assert paths[1] not in pyaud.files
+    pyaud.files.append(paths[1])
+    assert list(pyaud.files) == [paths[0], paths[2], paths[1]]
+    del pyaud.files[:2]
+    assert paths[0] not in pyaud.files
+    assert paths[1] in pyaud.files
+    pyaud.files.clear()
+    assert paths[1] not in pyaud.files
+    assert not pyaud.files
+    assert [] not in pyaud.files
+    pyaud.files.extend(paths)
+    pyaud.files.reverse()
+    assert list(pyaud.files) == paths[::-1]
+    assert all(p in pyaud.files for p in paths)
+    pyaud.files[0] = paths[0]
+    assert paths[2] not in pyaud.files
+    assert paths[0] in pyaud.files
+    pyaud.files[:] = [paths[2]]
+    assert paths[0] not in pyaud.files
+    assert paths[2] in pyaud.files
+
+
+@pytest.mark.usefixtures("unpatch_lsfiles_populate")
+def test_files_index_in_sync(mock_repo: FixtureMockRepo) -> None:
+    """Test every change to the file index is mirrored in its lookup.
+
+    The lookup is kept in sync by overriding the ``lsfiles`` methods
+    which change the index, so fail if ``lsfiles`` adds another.
+
+    :param mock_repo: Mock ``git.Repo`` class.
+    """
+    assert {
+        k
+        for c in LSFiles.__mro__
+        if c.__module__.startswith("lsfiles")
+        for k, v in vars(c).items()
+        if callable(v)
+    } == {
+        "__delitem__",
+        "__getitem__",
+        "__init__",
+        "__len__",
+        "__repr__",
+        "__setitem__",
+        "args",
+        "insert",
+        "populate",
+        "reduce",
+    }
+    paths = [Path.cwd() / python_file[i] for i in range(3)]
+    for path in paths:
+        path.touch()
+
+    mock_repo(ls_files=lambda: "\n".join(python_file[i] for i in range(3)))
+    changes: list[t.Callable[[], object]] = [
+        pyaud.files.populate,
+        pyaud.files.reverse,
+        lambda: pyaud.files.remove(paths[1]),
+        lambda: pyaud.files.append(paths[1]),
+        lambda: pyaud.files.insert(0, paths[2]),
+        lambda: pyaud.files.extend(paths),
+        pyaud.files.pop,
+        lambda: pyaud.files.__iadd__(paths),
+        lambda: pyaud.files.__setitem__(0, paths[1]),
+        lambda: pyaud.files.__setitem__(slice(1), paths[:1]),
+        lambda: pyaud.files.__delitem__(0),
+        lambda: pyaud.files.__delitem__(slice(1)),
+        pyaud.files.clear,
+    ]
+    for change in changes:
+        change()
+        assert Counter(pyaud.files._list) == pyaud.files._paths
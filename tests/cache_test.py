@@ -7,6 +7,7 @@ tests._cache_test
 from __future__ import annotations
 
 import json
+import os
 import typing as t
 from pathlib import Path
 
@@ -15,7 +16,15 @@ import pytest
 
 import pyaud
 
-from . import ContentHash, FixtureMain, FixtureMockRepo, flag, python_file
+from . import (
+    PARAMS,
+    ContentHash,
+    FixtureMain,
+    FixtureMockRepo,
+    flag,
+    plugin_name,
+    python_file,
+)
 
 FALLBACK = "fallback"
 UNCOMMITTED = "uncommitted"
@@ -680,3 +689,243 @@ def test_no_rev(main: FixtureMain, mock_repo: FixtureMockRepo) -> None:
     pyaud.plugins.register()(_Whitelist)
     returncode = main(name)
     assert returncode == 0
+
+
+def test_modified_same_size(main: FixtureMain) -> None:
+    """Test file modified without changing its size is audited again.
+
+    :param main: Patch package entry point.
+    """
+    files: list[Path] = []
+    path = Path.cwd() / python_file[0]
+    path.write_text("one")
+    os.utime(path, (0, 0))
+    pyaud.files.append(path)
+
+    class _Lint(pyaud.plugins.Audit):
+        cache = True
+
+        def audit(self, *args: str, **kwargs: bool) -> int:
+            files.extend(pyaud.files)
+            return 0
+
+    name = _Lint.__name__[1:].lower()
+    pyaud.plugins.register()(_Lint)
+    assert main(name) == 0
+    assert path in files
+    files.clear()
+    assert main(name) == 0
+    assert path not in files
+    path.write_text("two")
+    os.utime(path, (1, 1))
+    assert main(name) == 0
+    assert path in files
+
+
+def test_replaced_same_mtime_and_size(main: FixtureMain) -> None:
+    """Test file replaced with one of the same mtime and size is audited.
+
+    :param main: Patch package entry point.
+    """
+    files: list[Path] = []
+    path = Path.cwd() / python_file[0]
+    replacement = Path.cwd() / python_file[1]
+    path.write_text("one")
+    os.utime(path, (0, 0))
+    pyaud.files.append(path)
+
+    class _Lint(pyaud.plugins.Audit):
+        cache = True
+
+        def audit(self, *args: str, **kwargs: bool) -> int:
+            files.extend(pyaud.files)
+            return 0
+
+    name = _Lint.__name__[1:].lower()
+    pyaud.plugins.register()(_Lint)
+    assert main(name) == 0
+    files.clear()
+    replacement.write_text("two")
+    os.utime(replacement, (0, 0))
+    replacement.replace(path)
+    assert main(name) == 0
+    assert path in files
+
+
+def test_parent_replaced_by_file(main: FixtureMain) -> None:
+    """Test file whose parent directory is replaced by a file is dropped.
+
+    :param main: Patch package entry point.
+    """
+    parent = Path.cwd() / "package"
+    path = parent / python_file[0]
+    parent.mkdir()
+    path.write_text("one")
+    pyaud.files.append(path)
+
+    class _Lint(pyaud.plugins.Audit):
+        cache = True
+
+        def audit(self, *args: str, **kwargs: bool) -> int:
+            path.unlink()
+            parent.rmdir()
+            parent.write_text("two")
+            return 0
+
+    name = _Lint.__name__[1:].lower()
+    pyaud.plugins.register()(_Lint)
+    assert main(name) == 0
+    cache = json.loads((pyaud._cachedir.PATH / "files.json").read_text())
+    assert str(path.relative_to(Path.cwd())) not in cache[FALLBACK][str(_Lint)]
+
+
+def test_cache_file_is_directory(main: FixtureMain) -> None:
+    """Test cache that is a directory is neither read nor written.
+
+    :param main: Patch package entry point.
+    """
+    files: list[Path] = []
+    path = Path.cwd() / python_file[0]
+    path.write_text("one")
+    pyaud.files.append(path)
+    cache = pyaud._cachedir.PATH / "files.json"
+    cache.mkdir()
+
+    class _Lint(pyaud.plugins.Audit):
+        cache = True
+
+        def audit(self, *args: str, **kwargs: bool) -> int:
+            files.extend(pyaud.files)
+            return 0
+
+    name = _Lint.__name__[1:].lower()
+    pyaud.plugins.register()(_Lint)
+    assert main(name) == 0
+    assert main(name) == 0
+    assert files == [path, path]
+    assert cache.is_dir()
+
+
+def test_replaced_by_fifo(main: FixtureMain) -> None:
+    """Test file replaced by a fifo is dropped without opening it.
+
+    :param main: Patch package entry point.
+    """
+    path = Path.cwd() / python_file[0]
+    path.write_text("one")
+    pyaud.files.append(path)
+
+    class _Lint(pyaud.plugins.Audit):
+        cache = True
+
+        def audit(self, *args: str, **kwargs: bool) -> int:
+            path.unlink()
+            os.mkfifo(path)
+            return 0
+
+    name = _Lint.__name__[1:].lower()
+    pyaud.plugins.register()(_Lint)
+    assert main(name) == 0
+    cache = json.loads((pyaud._cachedir.PATH / "files.json").read_text())
+    assert python_file[0] not in cache[FALLBACK][str(_Lint)]
+
+
+def test_unmodified_file_read_once(
+    monkeypatch: pytest.MonkeyPatch, main: FixtureMain
+) -> None:
+    """Test file with an old unchanged mtime is only hashed once.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param main: Patch package entry point.
+    """
+    opened: list[Path] = []
+    path = Path.cwd() / python_file[0]
+    path.write_text("one")
+    os.utime(path, (0, 0))
+    pyaud.files.append(path)
+    path_open = Path.open
+
+    def _open(self: Path, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        opened.append(self)
+        return path_open(self, *args, **kwargs)
+
+    class _Lint(pyaud.plugins.Audit):
+        cache = True
+
+        def audit(self, *args: str, **kwargs: bool) -> int:
+            return 0
+
+    monkeypatch.setattr("pathlib.Path.open", _open)
+    name = _Lint.__name__[1:].lower()
+    pyaud.plugins.register()(_Lint)
+    assert main(name) == 0
+    assert main(name) == 0
+    assert opened.count(path) == 1
+
+
+def test_repo_queried_once(
+    main: FixtureMain, mock_repo: FixtureMockRepo
+) -> None:
+    """Test repository is only queried for commits once per run.
+
+    :param main: Patch package entry point.
+    :param mock_repo: Mock ``git.Repo`` class.
+    """
+    calls: list[None] = []
+    path = Path.cwd() / python_file[0]
+    path.write_text(CONTENT_HASHES[0].content_str)
+    pyaud.files.append(path)
+
+    def _rev_list(*_: str, **__: bool) -> str:
+        calls.append(None)
+        return ""
+
+    class _Params(pyaud.plugins.Parametrize):
+        def plugins(self) -> list[str]:
+            return [plugin_name[1], plugin_name[2], plugin_name[3]]
+
+    for count in range(1, 4):
+
+        class _Lint(pyaud.plugins.Audit):
+            cache = True
+
+            def audit(self, *args: str, **kwargs: bool) -> int:
+                return 0
+
+        pyaud.plugins.register(plugin_name[count])(_Lint)
+
+    mock_repo(rev_list=_rev_list)
+    pyaud.plugins.register(PARAMS)(_Params)
+    assert main(PARAMS) == 0
+    assert len(calls) == 1
+    assert main(PARAMS) == 0
+    assert len(calls) == 2
+
+
+def test_repo_queried_per_call(mock_repo: FixtureMockRepo) -> None:
+    """Test repository is queried again when a plugin is called again.
+
+    :param mock_repo: Mock ``git.Repo`` class.
+    """
+    calls: list[None] = []
+    path = Path.cwd() / python_file[0]
+    path.write_text(CONTENT_HASHES[0].content_str)
+    pyaud.files.append(path)
+
+    def _rev_list(*_: str, **__: bool) -> str:
+        calls.append(None)
+        return ""
+
+    class _Lint(pyaud.plugins.Audit):
+        cache = True
+
+        def audit(self, *args: str, **kwargs: bool) -> int:
+            return 0
+
+    mock_repo(rev_list=_rev_list)
+    pyaud.plugins.register(plugin_name[1])(_Lint)
+    (pyaud._cachedir.PATH / "files.json").write_text("{}")
+    assert pyaud.plugins.get(plugin_name[1])() == 0
+    assert len(calls) == 1
+    assert pyaud.plugins.get(plugin_name[1])() == 0
+    assert len(calls) == 2
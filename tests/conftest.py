@@ -11,6 +11,7 @@ import typing as t
 from pathlib import Path
 
 import pytest
+from lsfiles import LSFiles
 from mypy_extensions import KwArg, VarArg
 
 import pyaud
@@ -35,6 +36,7 @@ original_pyaud_plugin_load = pyaud.plugins.load
 original_pyaud_main_register_builtin_plugins = (
     _builtins.register_builtin_plugins
 )
+original_lsfiles_populate = LSFiles.populate
 
 
 @pytest.fixture(name="mock_environment", autouse=True)
@@ -109,6 +111,16 @@ def fixture_unpatch_plugins_load(monkeypatch: pytest.MonkeyPatch) -> None:
     :param monkeypatch: Mock patch environment and attributes.
     """
     monkeypatch.setattr("pyaud.plugins.load", original_pyaud_plugin_load)
+    original_pyaud_plugin_load.cache_clear()
+
+
+@pytest.fixture(name="unpatch_lsfiles_populate")
+def fixture_unpatch_lsfiles_populate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unpatch ``lsfiles.LSFiles.populate``.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    """
+    monkeypatch.setattr("lsfiles.LSFiles.populate", original_lsfiles_populate)
 
 
 @pytest.fixture(name=UNPATCH_REGISTER_DEFAULT_PLUGINS)